@@ -28,10 +28,7 @@ setup_kwargs = {
         'Intended Audience :: Developers',
         'Intended Audience :: Information Technology'
     ],
-    'python_requires': '>=2.7',
-    'extras_require': {
-        ':python_version == "2.7"': ['future']
-    },
+    'python_requires': '>=3.5',
     'keywords': 'WireGuard configuration config wg',
     'project_urls': {
         'Repository': 'https://www.github.com/towalink/wgconfig',
@@ -2,23 +2,22 @@
 
 """wgconfig.py: A class for parsing and writing WireGuard configuration files."""
 
-# The following imports are for Python2 support only
-from __future__ import with_statement
-from __future__ import absolute_import
-from __future__ import print_function
-from builtins import str
-from builtins import range
-from io import open
-
 
 __author__ = "Dirk Henrici"
 __license__ = "AGPL" # + author has right to release in parallel under different licenses
 __email__ = "towalink.wgconfig@henrici.name"
 
 
+import functools
 import os
 
 
+# Section headers in their usual spelling that can be recognized by a single lookup
+_SECTION_HEADERS = {'[Interface]': 'interface', '[Peer]': 'peer'}
+# Names of all supported sections
+_VALID_SECTIONS = frozenset(_SECTION_HEADERS.values())
+
+
 class WGConfig():
     """A class for parsing and writing WireGuard configuration files"""
     SECTION_DISABLED = '_disabled'
@@ -27,6 +26,10 @@ class WGConfig():
     SECTION_RAW = '_rawdata'
     _interface = None # interface attributes
     _peers = None # peer data
+    _sections = None # parsed sections (interface and peers) in order of the file
+    _shadowed = False # whether parsed sections have been overwritten by later ones with the same key
+    _peer_keys = None # keys of all peers in file order; derived from peer data on demand
+    _peer_disabled = None # one flag per entry of _peer_keys indicating whether the peer is disabled
 
     def __init__(self, file=None, keyattr='PublicKey'):
         """Object initialization"""
@@ -36,6 +39,7 @@ class WGConfig():
         self.initialize_file()
 
     @staticmethod
+    @functools.lru_cache(maxsize=256)
     def file2filename(file):
         """Handle special filenames: 'wg0' and 'wg0.conf' become '/etc/wireguard/wg0.conf' """
         if file is None:
@@ -50,10 +54,17 @@ class WGConfig():
         """Clears the data structs"""
         self._interface = None
         self._peers = None
+        self._sections = None
+        self._peer_keys = None
+        self._peer_disabled = None
 
     def read_from_fileobj(self, fobj):
         """Reads from the given file object into memory"""
-        self.lines = [line.rstrip() for line in fobj.readlines()]
+        # Read with a single call and split in one go instead of materializing a list of raw lines first
+        lines = fobj.read().split('\n')
+        if lines[-1] == '': # text ends with a newline or is empty
+            lines.pop()
+        self.lines = list(map(str.rstrip, lines))
         self.invalidate_data()
 
     def write_to_fileobj(self, fobj):
@@ -81,82 +92,209 @@ class WGConfig():
     @staticmethod
     def parse_line(line):
         """Splits a single attr/value line into its parts"""
-        attr, _, value = line.partition('=')
-        attr = attr.strip()
-        parts = value.partition('#')
-        value = parts[0].strip() # strip comments and whitespace
-        value = str(value) # this line is for Python2 support only
-        comment = parts[1] + parts[2]
-        if value.isnumeric():
-            value = [int(value)]
-        else:
-            value = [item.strip() for item in value.split(',')] # decompose into list based on commata as separator
-        return attr, value, comment
-
-    def parse_lines(self):
-        """Parses the lines of a WireGuard config file into memory"""
+        attr, _, rest = line.partition('=')
+        value, hash_, comment = rest.partition('#')
+        return attr.strip(), WGConfig.parse_value(value), hash_ + comment
 
-        # There will be two special attributes in the parsed data:
-        #_index_firstline: Line (zero indexed) of the section header (including any leading lines with comments)
-        #_index_lastline: Line (zero indexed) of the last attribute line of the section (including any directly following comments)
-
-        def close_section(section, section_data):
-            section_data = {k: (v if len(v) > 1 else v[0]) for k, v in section_data.items()}
+    @staticmethod
+    def parse_value(value):
+        """Converts the value part of an attr/value line (without comment) into a list of values"""
+        value = value.strip() # strip whitespace
+        if value.isdecimal(): # only plain digits; no signs or underscores as accepted by int()
+            return [int(value)]
+        return [item.strip() for item in value.split(',')] # decompose into list based on commata as separator
+
+    def _parse_range(self, start=0, stop=None, firstline=0):
+        """Parses the lines from index 'start' up to (excluding) index 'stop' into a list of (section, section_data) tuples
+
+        'start' needs to be zero or the index of a section header; 'firstline' is then the first line of that section.
+        'stop' needs to be the index of a section header (or None for parsing up to the end of the file).
+        Returns the parsed sections and the first line of the section starting at 'stop' (None if 'stop' is None).
+        """
+        sections = []
+
+        def close_section(section, section_data, section_lastline):
             if section is None: # nothing to close on first section
                 return
-            elif section == 'interface': # close interface section
-                self._interface = section_data
-            else: # close peer section
-                peername = section_data.get(self.keyattr)
-                self._peers[peername] = section_data
-            section_data[self.SECTION_RAW] = self.lines[section_data[self.SECTION_FIRSTLINE]:(section_data[self.SECTION_LASTLINE] + 1)]
+            for key, value in section_data.items(): # unpack single values in place
+                if len(value) == 1:
+                    section_data[key] = value[0]
+            section_data[self.SECTION_LASTLINE] = section_lastline
+            raw = self.lines[section_data[self.SECTION_FIRSTLINE]:(section_lastline + 1)]
+            section_data[self.SECTION_RAW] = raw
             # Checking if the section is disabled and adding an attribute to section data
-            if section_data[self.SECTION_RAW][0].startswith('#! '):
-                section_data[self.SECTION_DISABLED] = True
-            else:
-                section_data[self.SECTION_DISABLED] = False
+            section_data[self.SECTION_DISABLED] = raw[0].startswith('#! ')
+            sections.append((section, section_data))
 
-        self._interface = dict()
-        self._peers = dict()
+        if stop is None:
+            stop = len(self.lines)
         section = None
         section_data = dict()
-        last_empty_line_in_section = -1 # virtual empty line before start of file
-        for i, line in enumerate(self.lines):
+        section_lastline = None # kept as local variable while parsing as it changes on almost every line
+        last_empty_line_in_section = firstline - 1 # virtual empty line before start of section
+        for i in range(start, stop):
             # Ignore leading whitespace and trailing whitespace
-            line = line.replace('#! ', '').strip()
+            line = self.lines[i].replace('#! ', '').strip()
             # Ignore empty lines and comments
-            if len(line) == 0:
+            if not line:
                 last_empty_line_in_section = i
                 continue
-            if line.startswith('['): # section
+            if line[0] == '[': # section
                 if last_empty_line_in_section is not None:
-                    section_data[self.SECTION_LASTLINE] = [last_empty_line_in_section - 1]
-                close_section(section, section_data)
+                    section_lastline = last_empty_line_in_section - 1
+                close_section(section, section_data, section_lastline)
                 section_data = dict()
-                section = line[1:].partition(']')[0].lower()
+                section = _SECTION_HEADERS.get(line)
+                if section is None: # other spelling or trailing text
+                    section = line[1:].partition(']')[0].lower()
+                    if section not in _VALID_SECTIONS:
+                        raise ValueError('Unsupported section [{0}] in line {1}'.format(section, i))
                 if last_empty_line_in_section is None:
                     section_data[self.SECTION_FIRSTLINE] = [i]
                 else:
                     section_data[self.SECTION_FIRSTLINE] = [last_empty_line_in_section + 1]
                     last_empty_line_in_section = None
-                section_data[self.SECTION_LASTLINE] = [i]
-                if not section in ['interface', 'peer']:
-                    raise ValueError('Unsupported section [{0}] in line {1}'.format(section, i))
-            elif line.startswith('#'):
-                section_data[self.SECTION_LASTLINE] = [i]
+                section_data[self.SECTION_LASTLINE] = [i] # final value is set when closing the section
+                section_lastline = i
+            elif line[0] == '#':
+                section_lastline = i
             else: # regular line
-                attr, value, _comment = self.parse_line(line)
-                section_data[attr] = section_data.get(attr, [])
-                section_data[attr].extend(value)
-                section_data[self.SECTION_LASTLINE] = [i]
-        close_section(section, section_data)
-
-    def handle_leading_comment(self, leading_comment):
-        """Appends a leading comment for a section"""
+                attr, _, value = line.partition('=')
+                value = self.parse_value(value.partition('#')[0])
+                attr = attr.rstrip() # leading whitespace has already been stripped
+                section_data.setdefault(attr, []).extend(value)
+                section_lastline = i
+        # Close the last section like it would be done when reaching the next section header
+        next_firstline = None
+        if stop < len(self.lines):
+            if last_empty_line_in_section is None:
+                next_firstline = stop
+            else:
+                section_lastline = last_empty_line_in_section - 1
+                next_firstline = last_empty_line_in_section + 1
+        close_section(section, section_data, section_lastline)
+        return sections, next_firstline
+
+    def parse_lines(self):
+        """Parses the lines of a WireGuard config file into memory"""
+
+        # There will be two special attributes in the parsed data:
+        #_index_firstline: Line (zero indexed) of the section header (including any leading lines with comments)
+        #_index_lastline: Line (zero indexed) of the last attribute line of the section (including any directly following comments)
+
+        self._interface = dict()
+        self._peers = dict()
+        self._peer_keys = None
+        sections, _ = self._parse_range()
+        for section, section_data in sections:
+            if section == 'interface':
+                self._interface = section_data
+            else:
+                self._peers[section_data.get(self.keyattr)] = section_data
+        self._sections = [section_data for _section, section_data in sections]
+        # Sections overwritten by a later section with the same key cannot be updated incrementally
+        self._shadowed = (len(sections) != len(self._peers) + (1 if self._interface else 0))
+
+    def _find_section_header(self, index):
+        """Returns the index of the first section header line at or after the given line index"""
+        for i in range(index, len(self.lines)):
+            line = self.lines[i]
+            # Only lines containing a bracket can be headers; '#! ' needs to be removed anywhere like in parsing
+            if ('[' in line) and line.replace('#! ', '').lstrip().startswith('['):
+                return i
+        return len(self.lines)
+
+    def _find_section_position(self, index):
+        """Returns the number of sections (in order of the file) that start before the given line index"""
+        low, high = 0, len(self._sections)
+        while low < high:
+            middle = (low + high) // 2
+            if self._sections[middle][self.SECTION_FIRSTLINE] < index:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def _apply_line_delta(self, start_index, delta):
+        """Shifts the line indices of all sections starting at or after the given line index by delta"""
+        if delta == 0:
+            return
+        for i in range(self._find_section_position(start_index), len(self._sections)):
+            self._sections[i][self.SECTION_FIRSTLINE] += delta
+            self._sections[i][self.SECTION_LASTLINE] += delta
+
+    def _update_data(self, start, stop, delta):
+        """Updates the parsed data after lines 'start' up to (excluding) 'stop' have been replaced by 'stop - start + delta' lines
+
+        Only the sections around the change are parsed again, the line indices of all following sections are shifted.
+        """
+        if (self._interface is None) or (self._peers is None):
+            return # nothing parsed yet; data will be parsed on next access
+        self._peer_keys = None
+        if self._shadowed:
+            self.invalidate_data()
+            return
+        # Determine the two sections starting before the change and the first section starting after the change
+        position_start = self._find_section_position(start)
+        position_stop = self._find_section_position(stop)
+        next_section = self._sections[position_stop] if position_stop < len(self._sections) else None
+        # Parsing restarts at the header of the last section whose header has not been changed
+        window_start = window_firstline = window_position = 0
+        for position in range(position_start - 1, max(position_start - 3, -1), -1):
+            section_data = self._sections[position]
+            header = self._find_section_header(section_data[self.SECTION_FIRSTLINE])
+            if header < start:
+                window_start = header
+                window_firstline = section_data[self.SECTION_FIRSTLINE]
+                window_position = position
+                break
+        window_stop = None
+        if next_section is not None:
+            window_stop = self._find_section_header(next_section[self.SECTION_FIRSTLINE] + delta)
+        sections, next_firstline = self._parse_range(window_start, window_stop, window_firstline)
+        # Check that the parsed sections can replace the old ones without changing the order of peers
+        old_sections = self._sections[window_position:position_stop]
+        old_keys = [section_data.get(self.keyattr) for section_data in old_sections if section_data is not self._interface]
+        new_keys = [section_data.get(self.keyattr) for section, section_data in sections if section == 'peer']
+        new_interfaces = [section_data for section, section_data in sections if section == 'interface']
+        had_interface = any(section_data is self._interface for section_data in old_sections)
+        kept_keys = [key for key in new_keys if key in old_keys]
+        added_keys = [key for key in new_keys if key not in old_keys]
+        try:
+            consistent = ((len(set(new_keys)) == len(new_keys)) and (kept_keys + added_keys == new_keys)
+                          and (kept_keys == [key for key in old_keys if key in kept_keys])
+                          and not (added_keys and (next_section is not None))
+                          and not any(key in self._peers for key in added_keys)
+                          and (len(new_interfaces) == (1 if had_interface else 0)))
+        except TypeError: # unhashable key; let a full parse report it on next access
+            consistent = False
+        if not consistent:
+            self.invalidate_data()
+            return
+        # Shift following sections and replace the parsed ones
+        self._apply_line_delta(stop, delta)
+        for key in old_keys:
+            if key not in kept_keys:
+                del self._peers[key]
+        for section, section_data in sections:
+            if section == 'interface':
+                self._interface = section_data
+            else:
+                self._peers[section_data.get(self.keyattr)] = section_data
+        self._sections[window_position:position_stop] = [section_data for _section, section_data in sections]
+        # The first line of the next section depends on the lines before its header; its raw data only
+        # needs to be fetched again if that first line has moved (the lines of the section are unchanged)
+        if (next_section is not None) and (next_section[self.SECTION_FIRSTLINE] != next_firstline):
+            next_section[self.SECTION_FIRSTLINE] = next_firstline
+            next_section[self.SECTION_RAW] = self.lines[next_firstline:(next_section[self.SECTION_LASTLINE] + 1)]
+            next_section[self.SECTION_DISABLED] = self.lines[next_firstline].startswith('#! ')
+
+    def handle_leading_comment(self, leading_comment, lines=None):
+        """Appends a leading comment for a section (to the given list of lines or to the file)"""
         if leading_comment is not None:
             if leading_comment.strip()[0] != '#':
                 raise ValueError('A comment needs to start with a "#"')
-            self.lines.append(leading_comment)
+            (self.lines if lines is None else lines).append(leading_comment)
 
     def initialize_file(self, leading_comment=None):
         """Empties the file and adds the interface section header"""
@@ -171,23 +309,40 @@ class WGConfig():
             # Obtain a copy of the complete dictionary
             data = data.copy()
         else:
-            # Filter attributes starting with an underscore
-            data = { key: value for key, value in data.items() if not key.startswith('_') }
+            # Filter the private attributes added when parsing (their names start with an underscore)
+            data = data.copy()
+            for key in (self.SECTION_DISABLED, self.SECTION_FIRSTLINE, self.SECTION_LASTLINE, self.SECTION_RAW):
+                data.pop(key, None)
         return data    
 
     def get_interface(self, include_details=False):
         """Returns the data of the interface section"""
         return self.get_filtered_dictionary(self.interface, include_details)
 
+    def _get_peer_columns(self):
+        """Returns the keys of all peers and a bytearray with their disabled flags as parallel sequences"""
+        if self._peer_keys is None:
+            peers = self.peers
+            self._peer_keys = list(peers)
+            self._peer_disabled = bytearray(peerdata.get(self.SECTION_DISABLED, False) for peerdata in peers.values())
+        return self._peer_keys, self._peer_disabled
+
+    def enabled_peer_keys(self):
+        """Returns a list of the keys of all enabled peers"""
+        peer_keys, peer_disabled = self._get_peer_columns()
+        return [key for key, disabled in zip(peer_keys, peer_disabled) if not disabled]
+
     def get_peers(self, keys_only=True, include_disabled=False, include_details=False):
         """Returns peer data or a list of peers (i.e. their public keys)"""
+        if keys_only:
+            # Use the key and flag columns instead of looking into the data of each peer
+            if include_disabled:
+                return list(self._get_peer_columns()[0])
+            return self.enabled_peer_keys()
         # Get (possibly) filtered peers dictionary
         peerdata = { key: value for key, value in self.peers.items() if include_disabled or not value.get('_disabled', False) }
         # Return requested data
-        if keys_only:
-            return list(peerdata.keys())
-        else:
-            return { key: self.get_filtered_dictionary(value, include_details) for key, value in peerdata.items() }
+        return { key: self.get_filtered_dictionary(value, include_details) for key, value in peerdata.items() }
 
     def get_peer(self, key, include_details=False):
         """Returns the data of the peer with the given (public) key"""
@@ -201,13 +356,14 @@ class WGConfig():
         """Adds a new peer with the given (public) key"""
         if key in self.peers:
             raise KeyError('Peer to be added already exists')
-        self.lines.append('') # append an empty line for separation
-        self.handle_leading_comment(leading_comment) # add leading comment if needed
+        line_count = len(self.lines)
+        new_lines = [''] # empty line for separation
+        self.handle_leading_comment(leading_comment, new_lines) # add leading comment if needed
         # Append peer with key attribute
-        self.lines.append('[Peer]')
-        self.lines.append('{0} = {1}'.format(self.keyattr, key))
-        # Invalidate data cache
-        self.invalidate_data()
+        new_lines += ['[Peer]', '{0} = {1}'.format(self.keyattr, key)]
+        self.lines.extend(new_lines)
+        # Update data cache
+        self._update_data(line_count, line_count, len(new_lines))
 
     def del_peer(self, key):
         """Removes the peer with the given (public) key"""
@@ -219,14 +375,10 @@ class WGConfig():
         if section_firstline > 0:
             if len(self.lines[section_firstline - 1]) == 0:
                 section_firstline -= 1
-        # Only keep needed lines
-        result = []
-        if section_firstline > 0:
-            result.extend(self.lines[0:section_firstline])
-        result.extend(self.lines[(section_lastline + 1):])
-        self.lines = result
-        # Invalidate data cache
-        self.invalidate_data()
+        # Remove the lines of the peer section
+        del self.lines[section_firstline:(section_lastline + 1)]
+        # Update data cache
+        self._update_data(section_firstline, section_lastline + 1, section_firstline - section_lastline - 1)
 
     def get_sectioninfo(self, key):
         """Get first and last line of the section identified by the given key ("None" for interface section)"""
@@ -246,19 +398,22 @@ class WGConfig():
         if leading_comment is not None:
             if leading_comment.strip()[0] != '#':
                 raise ValueError('A comment needs to start with a "#"')
-        # Look for line with the attribute
+        # Look for line with the attribute; only lines with matching attribute name are parsed completely
         line_found = None
         for i in range(section_firstline + 1, section_lastline + 1):
-            line_attr, line_value, line_comment = self.parse_line(self.lines[i])
-            if attr == line_attr:
-                line_found = i
+            line = self.lines[i]
+            if line.split('=', 1)[0].strip() != attr:
+                continue
+            line_found = i
+            line_attr, line_value, line_comment = self.parse_line(line)
         # Add the attribute at the right place
         if (line_found is None) or append_as_line:
             line_found = section_lastline if (line_found is None) else line_found
             line_found += 1
             self.lines.insert(line_found, '{0} = {1}'.format(attr, value))
+            lines_replaced = 0
         else:
-            line_attr, line_value, line_comment = self.parse_line(self.lines[line_found])
+            lines_replaced = 1
             line_value.append(value)
             if len(line_comment) > 0:
                 line_comment = ' ' + line_comment
@@ -267,43 +422,49 @@ class WGConfig():
         # Handle leading comments
         if leading_comment is not None:
             self.lines.insert(line_found, leading_comment)
-        # Invalidate data cache
-        self.invalidate_data()
+        # Update data cache
+        lines_added = 1 - lines_replaced + (0 if leading_comment is None else 1)
+        self._update_data(line_found, line_found + lines_replaced, lines_added)
 
     def del_attr(self, key, attr, value=None, remove_leading_comments=True):
         """Removes an attribute/value pair from the given peer ("None" for removing an interface attribute); set 'value' to 'None' to remove all values"""
         section_firstline, section_lastline = self.get_sectioninfo(key)
         # Find all lines with matching attribute name and (if requested) value
         line_found = []
+        parsed_lines = dict()
         for i in range(section_firstline + 1, section_lastline + 1):
-            line_attr, line_value, line_comment = self.parse_line(self.lines[i])
-            if attr == line_attr:
-                if (value is None) or (value in line_value):
-                    line_found.append(i)
+            line = self.lines[i]
+            if line.split('=', 1)[0].strip() != attr:
+                continue
+            parsed_lines[i] = self.parse_line(line)
+            if (value is None) or (value in parsed_lines[i][1]):
+                line_found.append(i)
         if len(line_found) == 0:
             raise ValueError('The attribute/value to be deleted is not present')
-        # Process all relevant lines
-        for i in reversed(line_found): # reversed so that non-processed indices stay valid
+        # Process all relevant lines; lines to be removed are only collected here
+        line_count = len(self.lines)
+        to_delete = set()
+        for i in line_found:
             if value is None:
-                del(self.lines[i])
+                to_delete.add(i)
             else:
-                line_attr, line_value, line_comment = self.parse_line(self.lines[i])
+                line_attr, line_value, line_comment = parsed_lines[i]
                 line_value.remove(value)
                 if len(line_value) > 0: # keep remaining values in that line
                     self.lines[i] = line_attr + ' = ' + ', '.join(line_value) + line_comment
                 else: # otherwise line is no longer needed
-                    del(self.lines[i])
+                    to_delete.add(i)
         # Handle leading comments
+        changed_firstline = line_found[0]
         if remove_leading_comments:
-            i = line_found[0] - 1
-            while i > 0:
-                if len(self.lines[i]) and (self.lines[i][0] == '#'):
-                    del(self.lines[i])
-                    i -= 1
-                else:
-                    break
-        # Invalidate data cache
-        self.invalidate_data()
+            while (changed_firstline > 1) and self.lines[changed_firstline - 1].startswith('#'):
+                changed_firstline -= 1
+                to_delete.add(changed_firstline)
+        # Remove the collected lines with a single slice assignment over the changed lines
+        changed_lines = self.lines[changed_firstline:(line_found[-1] + 1)]
+        self.lines[changed_firstline:(line_found[-1] + 1)] = [line for i, line in enumerate(changed_lines, changed_firstline) if i not in to_delete]
+        # Update data cache
+        self._update_data(changed_firstline, line_found[-1] + 1, len(self.lines) - line_count)
 
     def get_peer_enabled(self, key):
         """Checks whether the peer with the given (public) key is enabled"""
@@ -316,34 +477,28 @@ class WGConfig():
             raise KeyError('The peer to be enabled does not exist')
         section_firstline = self.peers[key][self.SECTION_FIRSTLINE]
         section_lastline = self.peers[key][self.SECTION_LASTLINE]
-        result = []
         # Remove #! from lines
-        for i, line in enumerate(self.lines):
-            if section_firstline <= i <= section_lastline:
-                line = line.replace('#! ', '')
-            result.append(line)
-        self.lines = result
-        # Invalidate data cache
-        self.invalidate_data()
+        section_lines = self.lines[section_firstline:(section_lastline + 1)]
+        self.lines[section_firstline:(section_lastline + 1)] = [line.replace('#! ', '') for line in section_lines]
+        # Update data cache
+        self._update_data(section_firstline, section_lastline + 1, 0)
 
     def disable_peer(self, key):
         """Disables the peer with the given (public) key by appending #! to all lines in a peer section"""
         if key not in self.peers:
             raise KeyError('The peer to be disabled does not exist')
-        if not self.get_peer_enabled(key):
+        peerdata = self.peers[key]
+        section_firstline = peerdata[self.SECTION_FIRSTLINE]
+        section_lastline = peerdata[self.SECTION_LASTLINE]
+        if self.lines[section_firstline].startswith('#! '):
             return; # nothing to do anymore if peer is already disabled
-        section_firstline = self.peers[key][self.SECTION_FIRSTLINE]
-        section_lastline = self.peers[key][self.SECTION_LASTLINE]
-        result = []
-        # Append #! to lines
-        for i, line in enumerate(self.lines):
-            prefix = ''
-            if section_firstline <= i <= section_lastline:
-                prefix = '#! '
-            result.append(prefix + line)
-        self.lines = result
-        # Invalidate data cache
-        self.invalidate_data()
+        # Prepend #! to lines
+        section_lines = self.lines[section_firstline:(section_lastline + 1)]
+        self.lines[section_firstline:(section_lastline + 1)] = ['#! ' + line for line in section_lines]
+        # Update data cache; prepending #! does not change the parsed attributes
+        peerdata[self.SECTION_RAW] = self.lines[section_firstline:(section_lastline + 1)]
+        peerdata[self.SECTION_DISABLED] = True
+        self._peer_keys = None
 
     @property
     def interface(self):
@@ -217,6 +217,18 @@ def test_get_peer(setup_testconfig1):
                         'PersistentKeepalive': 25,
                         'PublicKey': 'XWItB4SR1qwGbGn59oRE6TBlTYHQF0pDy1x63dlr5nA='}
 
+def test_get_peer_underscore_attribute():
+    """Only the private attributes added when parsing are filtered, not attributes from the file"""
+    import io
+    import wgconfig
+    wc = wgconfig.WGConfig()
+    wc.read_from_fileobj(io.StringIO('[Interface]\n\n[Peer]\nPublicKey = newkey=\n_Custom = x\n'))
+    peerdata = wc.get_peer('newkey=')
+    assert peerdata == {'PublicKey': 'newkey=', '_Custom': 'x'}
+    for key in ('_rawdata', '_disabled', '_index_firstline', '_index_lastline'):
+        assert key not in peerdata
+    assert wc.get_peer('newkey=', include_details=True)['_Custom'] == 'x'
+
 def test_add_peer(setup_testconfig1):
     wc = setup_testconfig1
     wc.add_peer('801mgm2JhjTOCxfihEknzFJGYxDvi+8oVYBrWe3hOWM=')
@@ -1023,3 +1035,52 @@ def test_enable_twice_peer3(setup_testconfig1):
                                                                            'PersistentKeepalive = 25']}}
     assert wc.peers == peers
     assert wc.get_peer_enabled('ivBDO+pT2m4W5bl7ApNaC3BybEtYa1fvNpA4h+tHyy8=')        
+
+def test_incremental_update_matches_full_parse(setup_testconfig1):
+    """Data updated on modifications needs to be equal to data parsed from scratch"""
+    wc = setup_testconfig1
+    for i in range(10):
+        wc.add_peer('TESTKEY{0}='.format(i), '# Peer {0}'.format(i))
+        wc.add_attr('TESTKEY{0}='.format(i), 'AllowedIPs', '10.0.0.{0}/32'.format(i))
+    wc.add_attr('eBvBVLo6wH0XkBfIjeLPf8ydBTfU/gMqJOH4nmVXcDE=', 'AllowedIPs', '10.0.0.1/16', '# TEST')
+    wc.del_attr(None, 'ListenPort')
+    wc.del_peer('TESTKEY3=')
+    wc.disable_peer('TESTKEY5=')
+    wc.enable_peer('ivBDO+pT2m4W5bl7ApNaC3BybEtYa1fvNpA4h+tHyy8=')
+    output_data(wc)
+    interface, peers = wc.interface, wc.peers
+    wc.invalidate_data()
+    assert interface == wc.interface
+    assert list(peers.items()) == list(wc.peers.items())
+
+def test_parse_value_integers():
+    """Only plain decimal values are converted to integers"""
+    import wgconfig
+    assert wgconfig.WGConfig.parse_value(' 25 ') == [25]
+    assert wgconfig.WGConfig.parse_value('+5') == ['+5']
+    assert wgconfig.WGConfig.parse_value('1_000') == ['1_000']
+    assert wgconfig.WGConfig.parse_value('²') == ['²']
+
+def test_get_peers_keys_only(setup_testconfig1):
+    wc = setup_testconfig1
+    assert wc.get_peers() == ['XWItB4SR1qwGbGn59oRE6TBlTYHQF0pDy1x63dlr5nA=',
+                              'eBvBVLo6wH0XkBfIjeLPf8ydBTfU/gMqJOH4nmVXcDE=']
+    assert wc.get_peers(include_disabled=True) == ['XWItB4SR1qwGbGn59oRE6TBlTYHQF0pDy1x63dlr5nA=',
+                                                   'eBvBVLo6wH0XkBfIjeLPf8ydBTfU/gMqJOH4nmVXcDE=',
+                                                   'ivBDO+pT2m4W5bl7ApNaC3BybEtYa1fvNpA4h+tHyy8=']
+    wc.disable_peer('XWItB4SR1qwGbGn59oRE6TBlTYHQF0pDy1x63dlr5nA=')
+    assert wc.get_peers() == ['eBvBVLo6wH0XkBfIjeLPf8ydBTfU/gMqJOH4nmVXcDE=']
+
+def test_enabled_peer_keys(setup_testconfig1):
+    wc = setup_testconfig1
+    assert wc.enabled_peer_keys() == wc.get_peers()
+    wc.enable_peer('ivBDO+pT2m4W5bl7ApNaC3BybEtYa1fvNpA4h+tHyy8=')
+    assert wc.enabled_peer_keys() == wc.get_peers(include_disabled=True)
+
+def test_add_peer_invalid_comment(setup_testconfig1):
+    """An invalid leading comment must not leave partial lines behind"""
+    wc = setup_testconfig1
+    lines = list(wc.lines)
+    with pytest.raises(ValueError):
+        wc.add_peer('newkey=', 'not a comment')
+    assert wc.lines == lines